@@ -2,11 +2,36 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import inspect
+
 
 __all__ = ["BaseArtist"]
 
 
 _ITEM_ARTIST = {}
+_ITEM_ARTIST_RESOLVED = {}
+_ITEM_ARTIST_FROZEN = False
+
+
+def _resolve_artist(cls):
+    """Find the artist type registered for a type of item or for the closest of its base types.
+
+    The result is cached per item type.
+    The cache is reset whenever a new item-artist pair is registered,
+    which is no longer possible once the registry is frozen.
+    """
+    try:
+        return _ITEM_ARTIST_RESOLVED[cls]
+    except KeyError:
+        pass
+    for base in inspect.getmro(cls):
+        if base in _ITEM_ARTIST:
+            artist_type = _ITEM_ARTIST[base]
+            break
+    else:
+        raise KeyError(cls)
+    _ITEM_ARTIST_RESOLVED[cls] = artist_type
+    return artist_type
 
 
 class BaseArtist(object):
@@ -15,7 +40,21 @@ class BaseArtist(object):
 
     @staticmethod
     def register(item_type, artist_type):
+        if _ITEM_ARTIST_FROZEN:
+            raise Exception('The item-artist registry is frozen. No more artist types can be registered.')
         _ITEM_ARTIST[item_type] = artist_type
+        _ITEM_ARTIST_RESOLVED.clear()
+
+    @staticmethod
+    def freeze_registry():
+        """Freeze the item-artist registry.
+
+        After freezing, no more item-artist pairs can be registered,
+        and the artist types resolved per item type by ``~BaseArtist.build`` remain valid for the rest of the session.
+        This should be called after all artists (including those of plugins) have been registered.
+        """
+        global _ITEM_ARTIST_FROZEN
+        _ITEM_ARTIST_FROZEN = True
 
     @staticmethod
     def build(item, **kwargs):
@@ -32,8 +71,10 @@ class BaseArtist(object):
         :class:`compas.scene.BaseArtist`
             An artist of the type matching the provided item according to an item-artist map.
             The map is created by registering item-artist type pairs using ``~BaseArtist.register``.
+            If no artist type is registered for the exact type of the item,
+            the artist type of the closest registered base type is used.
         """
-        artist_type = _ITEM_ARTIST[type(item)]
+        artist_type = _resolve_artist(type(item))
         artist = artist_type(item, **kwargs)
         return artist
 
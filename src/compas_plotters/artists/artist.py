@@ -1,3 +1,5 @@
+from numpy import asarray
+
 __all__ = ['Artist']
 
 
@@ -10,6 +12,7 @@ class Artist(object):
     def __init__(self, item):
         self.plotter = None
         self.item = item
+        self._bbox = None
 
     @staticmethod
     def register(item_type, artist_type):
@@ -37,6 +40,36 @@ class Artist(object):
     def data(self):
         raise NotImplementedError
 
+    @property
+    def bbox(self):
+        """tuple: The extents of the data of the artist, as ``(xmin, xmax, ymin, ymax)``.
+
+        The extents are computed once and reused until :meth:`invalidate_bbox` is called.
+        If the artist has no data, the extents are ``None``.
+        """
+        if self._bbox is None:
+            data = self.data
+            if not data:
+                return None
+            points = asarray(data, dtype=float)
+            xmin, ymin = points.min(axis=0)
+            xmax, ymax = points.max(axis=0)
+            self._bbox = float(xmin), float(xmax), float(ymin), float(ymax)
+        return self._bbox
+
+    def invalidate_bbox(self):
+        """Invalidate the cached extents of the data of the artist."""
+        self._bbox = None
+
+    @property
+    def mpl_artist(self):
+        """The matplotlib artist representing the item.
+
+        This is ``None`` if nothing was drawn, or if the artist does not expose its matplotlib artist.
+        In the latter case, the plotter redraws the entire figure instead of blitting the artists.
+        """
+        return None
+
     def draw(self):
         raise NotImplementedError
 
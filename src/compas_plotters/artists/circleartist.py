@@ -35,6 +35,10 @@ class CircleArtist(Artist):
         points[3][1] += self.circle.radius
         return points
 
+    @property
+    def mpl_artist(self):
+        return self._mpl_circle
+
     def update_data(self):
         self.plotter.axes.update_datalim(self.data)
 
@@ -58,6 +62,7 @@ class CircleArtist(Artist):
         self._mpl_circle.set_edgecolor(self.edgecolor)
         self._mpl_circle.set_facecolor(self.facecolor)
         self.update_data()
+        self.invalidate_bbox()
 
 
 # ==============================================================================
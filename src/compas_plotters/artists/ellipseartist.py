@@ -34,6 +34,10 @@ class EllipseArtist(Artist):
         points[3][1] += self.ellipse.minor
         return points
 
+    @property
+    def mpl_artist(self):
+        return self._mpl_ellipse
+
     def update_data(self):
         self.plotter.axes.update_datalim(self.data)
 
@@ -54,6 +58,7 @@ class EllipseArtist(Artist):
         self._mpl_ellipse.set_height(2*self.ellipse.minor)
         self._mpl_ellipse.set_edgecolor(self.edgecolor)
         self._mpl_ellipse.set_facecolor(self.facecolor)
+        self.invalidate_bbox()
 
 
 # ==============================================================================
@@ -35,6 +35,10 @@ class LineArtist(Artist):
     def data(self):
         return [self.line.start[:2], self.line.end[:2]]
 
+    @property
+    def mpl_artist(self):
+        return self._mpl_line
+
     def draw(self):
         if self._draw_as_segment:
             x0, y0 = self.line.start[:2]
@@ -82,6 +86,7 @@ class LineArtist(Artist):
                 self._mpl_line.set_ydata([y0, y1])
                 self._mpl_line.set_color(self.color)
                 self._mpl_line.set_linewidth(self.linewidth)
+        self.invalidate_bbox()
 
 
 # ==============================================================================
@@ -38,6 +38,10 @@ class PointArtist(Artist):
     def data(self):
         return [self.point[:2]]
 
+    @property
+    def mpl_artist(self):
+        return self._mpl_circle
+
     def update_data(self):
         self.plotter.axes.update_datalim(self.data)
 
@@ -59,6 +63,7 @@ class PointArtist(Artist):
         self._mpl_circle.set_facecolor(self.facecolor)
         self._mpl_circle.set_transform(self._T)
         self.update_data()
+        self.invalidate_bbox()
 
 
 # ==============================================================================
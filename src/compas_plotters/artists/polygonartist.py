@@ -25,6 +25,10 @@ class PolygonArtist(Artist):
     def data(self):
         return [point[:2] for point in self.polygon.points]
 
+    @property
+    def mpl_artist(self):
+        return self._mpl_polygon
+
     def draw(self):
         polygon = PolygonPatch(self.data,
                                linewidth=self.linewidth,
@@ -34,13 +38,14 @@ class PolygonArtist(Artist):
                                zorder=self.zorder,
                                alpha=self.alpha,
                                fill=self.fill)
-        self.mpl_polygon = self.plotter.axes.add_patch(polygon)
+        self._mpl_polygon = self.plotter.axes.add_patch(polygon)
 
     def redraw(self):
-        self.mpl_polygon.set_xy(self.data)
-        self.mpl_polygon.set_facecolor(self.facecolor)
-        self.mpl_polygon.set_edgecolor(self.edgecolor)
-        self.mpl_polygon.set_linewidth(self.linewidth)
+        self._mpl_polygon.set_xy(self.data)
+        self._mpl_polygon.set_facecolor(self.facecolor)
+        self._mpl_polygon.set_edgecolor(self.edgecolor)
+        self._mpl_polygon.set_linewidth(self.linewidth)
+        self.invalidate_bbox()
 
 
 # ==============================================================================
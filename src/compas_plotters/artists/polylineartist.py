@@ -23,6 +23,10 @@ class PolylineArtist(Artist):
     def data(self):
         return [point[:2] for point in self.polyline.points]
 
+    @property
+    def mpl_artist(self):
+        return self._mpl_polyline
+
     def draw(self):
         x, y, _ = zip(* self.polyline.points)
         line2d = Line2D(x, y,
@@ -30,14 +34,15 @@ class PolylineArtist(Artist):
                         linestyle=self.linestyle,
                         color=self.color,
                         zorder=self.zorder)
-        self.mpl_line = self.plotter.axes.add_line(line2d)
+        self._mpl_polyline = self.plotter.axes.add_line(line2d)
 
     def redraw(self):
         x, y, _ = zip(* self.polyline.points)
-        self.mpl_line.set_xdata(x)
-        self.mpl_line.set_ydata(y)
-        self.mpl_line.set_color(self.color)
-        self.mpl_line.set_linewidth(self.width)
+        self._mpl_polyline.set_xdata(x)
+        self._mpl_polyline.set_ydata(y)
+        self._mpl_polyline.set_color(self.color)
+        self._mpl_polyline.set_linewidth(self.width)
+        self.invalidate_bbox()
 
 
 # ==============================================================================
@@ -25,6 +25,10 @@ class VectorArtist(Artist):
     def data(self):
         return [self.point[:2], (self.point + self.vector)[:2]]
 
+    @property
+    def mpl_artist(self):
+        return self._mpl_vector
+
     def draw(self):
         style = ArrowStyle("Simple, head_length=.1, head_width=.1, tail_width=.02")
         arrow = FancyArrowPatch(self.point[:2], (self.point + self.vector)[:2],
@@ -39,6 +43,7 @@ class VectorArtist(Artist):
 
     def redraw(self):
         self._mpl_vector.set_positions(self.point[:2], (self.point + self.vector)[:2])
+        self.invalidate_bbox()
 
 
 # ==============================================================================
@@ -1,5 +1,10 @@
+import io
+import os
+
 import matplotlib.pyplot as plt
 
+from numpy import asarray
+
 from compas_plotters import Artist
 
 __all__ = ['GeometryPlotter']
@@ -31,9 +36,12 @@ class GeometryPlotter:
     def __init__(self, view=[(-8, 16), (-5, 10)], figsize=(8, 5), dpi=100, bgcolor=(1.0, 1.0, 1.0), show_axes=False):
         self._show_axes = show_axes
         self._bgcolor = None
+        self._bgcolor_dirty = False
         self._viewbox = None
         self._axes = None
         self._artists = []
+        self._background = None
+        self._background_view = None
         self.viewbox = view
         self.figsize = figsize
         self.dpi = dpi
@@ -65,16 +73,32 @@ class GeometryPlotter:
         For more info, see the documentation of the Axes class ([1]_) and the
         axis and tick API ([2]_).
 
+        If the figure of the axes was closed in the meantime,
+        a new figure and axes are created, provided no artists were added yet.
+        Otherwise, an exception is raised, because the artists were drawn on the closed figure.
+
         References
         ----------
         .. [1] https://matplotlib.org/api/axes_api.html
         .. [2] https://matplotlib.org/api/axis_api.html
 
         """
+        if self._axes and not plt.fignum_exists(self._axes.figure.number):
+            if self._artists:
+                raise Exception('The figure of the plotter was closed. Its artists can no longer be drawn.')
+            self._axes = None
+            self._background = None
         if not self._axes:
             figure = plt.figure(facecolor=self.bgcolor,
                                 figsize=self.figsize,
-                                dpi=self.dpi)
+                                dpi=self.dpi,
+                                constrained_layout=True)
+            # pad the axes like ``tight_layout`` does: 1.08 times the font size, in inches
+            pad = 1.08 * plt.rcParams['font.size'] / 72
+            if hasattr(figure, 'get_layout_engine'):
+                figure.get_layout_engine().set(w_pad=pad, h_pad=pad)
+            else:
+                figure.set_constrained_layout_pads(w_pad=pad, h_pad=pad)
             axes = figure.add_subplot(111, aspect='equal')
             if self.viewbox:
                 xmin, xmax = self.viewbox[0]
@@ -83,8 +107,11 @@ class GeometryPlotter:
                 axes.set_ylim(ymin, ymax)
             axes.set_xscale('linear')
             axes.set_yscale('linear')
+            axes.grid(False)
+            axes.set_xticks([])
+            axes.set_yticks([])
+            axes.set_frame_on(self._show_axes)
             if self._show_axes:
-                axes.set_frame_on(True)
                 # major_xticks = np.arange(0, 501, 20)
                 # major_yticks = np.arange(0, 301, 20)
                 # minor_xticks = np.arange(0, 501, 5)
@@ -97,23 +124,12 @@ class GeometryPlotter:
                 # ax.set_yticks(minor_yticks, minor = True)
                 # axes.tick_params(labelbottom=False, labelleft=False)
                 # axes.grid(axis='both', linestyle='--', linewidth=0.5, color=(0.7, 0.7, 0.7))
-                axes.grid(False)
-                axes.set_xticks([])
-                axes.set_yticks([])
-                axes.spines['top'].set_color('none')
-                axes.spines['right'].set_color('none')
-                axes.spines['left'].set_position('zero')
-                axes.spines['bottom'].set_position('zero')
-                axes.spines['left'].set_linestyle('-')
-                axes.spines['bottom'].set_linestyle('-')
-            else:
-                axes.grid(False)
-                axes.set_frame_on(False)
-                axes.set_xticks([])
-                axes.set_yticks([])
-            axes.autoscale_view()
-            plt.tight_layout()
+                spines = axes.spines
+                plt.setp([spines['top'], spines['right']], color='none')
+                plt.setp([spines['left'], spines['bottom']], position='zero', linestyle='-')
             self._axes = axes
+            self._bgcolor_dirty = False
+            figure.canvas.mpl_connect('draw_event', self._on_draw)
         return self._axes
 
     @property
@@ -165,9 +181,13 @@ class GeometryPlotter:
             Colors should be specified in the form of a string (hex colors) or
             as a tuple of normalized RGB components.
 
+        Notes
+        -----
+        The color is applied to the figure the next time the plot is drawn or saved.
+
         """
         self._bgcolor = value
-        self.figure.set_facecolor(value)
+        self._bgcolor_dirty = True
 
     @property
     def title(self):
@@ -211,16 +231,29 @@ class GeometryPlotter:
             plt.pause(pause)
 
     def zoom_extents(self):
+        """Zoom the view to the extents of the artists.
+
+        Notes
+        -----
+        The cached extents of the artists are used (see :attr:`compas_plotters.artists.Artist.bbox`).
+        These are updated when the artists are redrawn,
+        so changes to the items since the last redraw are not taken into account.
+
+        """
         width, height = self.figsize
         fig_aspect = width / height
-        data = []
-        for artist in self.artists:
-            data += artist.data
-        x, y = zip(* data)
-        xmin = min(x)
-        xmax = max(x)
-        ymin = min(y)
-        ymax = max(y)
+        if len(self.artists) == 1:
+            bbox = self.artists[0].bbox
+            if bbox is None:
+                return
+            xmin, xmax, ymin, ymax = bbox
+        else:
+            bboxes = [artist.bbox for artist in self.artists if artist.bbox is not None]
+            if not bboxes:
+                return
+            bboxes = asarray(bboxes)
+            xmin, ymin = bboxes[:, 0::2].min(axis=0)
+            xmax, ymax = bboxes[:, 1::2].max(axis=0)
         xspan = xmax - xmin
         yspan = ymax - ymin
         data_aspect = xspan / yspan
@@ -233,12 +266,14 @@ class GeometryPlotter:
             self.axes.set_xlim(xmin - 0.1 * xspan, xmax + 0.1 * xspan)
             self.axes.set_ylim(scale * (ymin - 0.1 * yspan), scale * (ymax + 0.1 * yspan))
         self.axes.autoscale_view()
+        self._background = None
 
     def add(self, item, artist=None, **kwargs):
         if not artist:
             artist = Artist.build(item, **kwargs)
         artist.plotter = self
         artist.draw()
+        self._animate(artist)
         self._artists.append(artist)
         return artist
 
@@ -246,6 +281,7 @@ class GeometryPlotter:
         artist = Artist.build_as(item, artist_type, **kwargs)
         artist.plotter = self
         artist.draw()
+        self._animate(artist)
         self._artists.append(artist)
         return artist
 
@@ -286,11 +322,27 @@ class GeometryPlotter:
         """
         self.figure.canvas.mpl_connect('pick_event', listener)
 
-    def draw(self, pause=None):
-        self.figure.canvas.draw()
+    def draw(self, pause=None, force=False):
+        """Draws the plot.
+
+        Parameters
+        ----------
+        pause : float, optional
+            Ammount of time to pause the plot in seconds.
+        force : bool, optional
+            If ``True``, draw the figure immediately.
+            Otherwise, request a draw at the next iteration of the GUI event loop,
+            such that multiple requests are combined into a single repaint.
+            Default is ``False``.
+
+        """
+        self._apply_pending()
+        if force:
+            self.figure.canvas.draw()
+        else:
+            self.figure.canvas.draw_idle()
         self.figure.canvas.flush_events()
-        if pause:
-            plt.pause(pause)
+        self.pause(pause)
 
     def redraw(self, pause=None):
         """Updates and pauses the plot.
@@ -300,19 +352,80 @@ class GeometryPlotter:
         pause : float
             Ammount of time to pause the plot in seconds.
 
+        Notes
+        -----
+        The matplotlib artists of the artists are animated ([1]_).
+        They are excluded from full draws of the figure, which only produce the background.
+        After every full draw, a snapshot of the background is stored
+        and the artists are drawn on top of it.
+        On redraw, only the artists are drawn on top of that snapshot and the result is blitted to the canvas.
+        If the view has changed since the snapshot was taken,
+        or if not all artists expose their matplotlib artist,
+        the entire figure is redrawn instead.
+
+        References
+        ----------
+        .. [1] https://matplotlib.org/stable/tutorials/advanced/blitting.html
+
         """
+        self._apply_pending()
         for artist in self._artists:
             artist.redraw()
-        self.figure.canvas.draw()
+        if not self._can_blit() or self._background is None or self._view() != self._background_view:
+            self.figure.canvas.draw()
+        else:
+            self.figure.canvas.restore_region(self._background)
+            for mpl_artist in self._mpl_artists():
+                self.axes.draw_artist(mpl_artist)
+            self.figure.canvas.blit(self.axes.bbox)
         self.figure.canvas.flush_events()
-        if pause:
-            plt.pause(pause)
+        self.pause(pause)
+
+    def _apply_pending(self):
+        """Apply the figure properties that were changed since the last draw."""
+        if self._bgcolor_dirty:
+            self.figure.set_facecolor(self._bgcolor)
+            self._bgcolor_dirty = False
+            self._background = None
+
+    def _mpl_artists(self):
+        """Collect the matplotlib artists of all artists, in drawing order."""
+        mpl_artists = [artist.mpl_artist for artist in self._artists if artist.mpl_artist is not None]
+        mpl_artists.sort(key=lambda mpl_artist: mpl_artist.get_zorder())
+        return mpl_artists
+
+    def _view(self):
+        """Identify the current view of the axes, to check if the blitting background is still valid."""
+        return tuple(self.axes.get_xlim()) + tuple(self.axes.get_ylim()) + tuple(self.axes.bbox.bounds)
+
+    def _animate(self, artist):
+        """Exclude the matplotlib artist of an artist from full draws, such that it can be blitted."""
+        if artist.mpl_artist is not None and getattr(self.figure.canvas, 'supports_blit', False):
+            artist.mpl_artist.set_animated(True)
+
+    def _on_draw(self, event):
+        """Store a snapshot of the background after a full draw, and draw the animated artists on top of it."""
+        if event.canvas.is_saving():
+            # animated artists are included in the output when saving
+            return
+        if not getattr(self.figure.canvas, 'supports_blit', False):
+            return
+        self._background = self.figure.canvas.copy_from_bbox(self.axes.bbox)
+        self._background_view = self._view()
+        for mpl_artist in self._mpl_artists():
+            self.axes.draw_artist(mpl_artist)
+
+    def _can_blit(self):
+        """Check if the canvas supports blitting and all artists expose their matplotlib artist."""
+        if not getattr(self.figure.canvas, 'supports_blit', False):
+            return False
+        return all(type(artist).mpl_artist is not Artist.mpl_artist for artist in self._artists)
 
     def show(self):
         """Displays the plot.
 
         """
-        self.draw()
+        self.draw(force=True)
         plt.show()
 
     def save(self, filepath, **kwargs):
@@ -320,19 +433,40 @@ class GeometryPlotter:
 
         Parameters
         ----------
-        filepath : str
-            Full path of the file.
+        filepath : str or file-like object
+            Full path of the file, or a file-like object to write to.
 
         Notes
         -----
         For an overview of all configuration options, see [1]_.
 
+        When saving to a path, raster images are written directly to the file through a large write buffer.
+        For other formats, the figure is rendered into an in-memory buffer first,
+        and then written to the file in one go.
+        File-like objects are passed to matplotlib as is.
+
         References
         ----------
         .. [1] https://matplotlib.org/2.0.2/api/pyplot_api.html#matplotlib.pyplot.savefig
 
         """
-        plt.savefig(filepath, **kwargs)
+        self._apply_pending()
+        if not isinstance(filepath, (str, os.PathLike)):
+            self.figure.savefig(filepath, **kwargs)
+            return
+        ext = os.path.splitext(filepath)[1][1:].lower()
+        fmt = kwargs.pop('format', None) or ext
+        if fmt not in self.figure.canvas.get_supported_filetypes():
+            self.figure.savefig(filepath, format=fmt or None, **kwargs)
+            return
+        if fmt in ('png', 'jpg', 'jpeg', 'tif', 'tiff'):
+            with open(filepath, 'wb', buffering=1 << 18) as f:
+                self.figure.savefig(f, format=fmt, **kwargs)
+            return
+        buffer = io.BytesIO()
+        self.figure.savefig(buffer, format=fmt, **kwargs)
+        with open(filepath, 'wb') as f:
+            f.write(buffer.getbuffer())
 
 
 # ==============================================================================
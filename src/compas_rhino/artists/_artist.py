@@ -0,0 +1,81 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+import compas_rhino
+from compas.scene import BaseArtist
+
+
+__all__ = ["Artist"]
+
+
+class Artist(BaseArtist):
+    """Base class for all Rhino artists."""
+
+    def __init__(self):
+        self._guids = []
+
+    @staticmethod
+    def draw_collection(collection):
+        raise NotImplementedError
+
+    @staticmethod
+    def clear_all(artists):
+        """Delete the Rhino objects created by multiple artists at once.
+
+        Parameters
+        ----------
+        artists : list of :class:`compas_rhino.artists.Artist`
+            The artists.
+
+        Notes
+        -----
+        The objects of all artists are deleted in a single call,
+        and the Rhino views are redrawn only once afterwards.
+
+        """
+        guids = [guid for artist in artists for guid in artist._guids]
+        if not guids:
+            return
+        compas_rhino.rs.EnableRedraw(False)
+        try:
+            compas_rhino.delete_objects(guids, redraw=False)
+            for artist in artists:
+                artist._guids = []
+        finally:
+            compas_rhino.rs.EnableRedraw(True)
+
+    def draw(self):
+        raise NotImplementedError
+
+    @staticmethod
+    def flush():
+        """Force an immediate redraw of the Rhino views."""
+        compas_rhino.rs.Redraw()
+
+    def redraw(self):
+        """Redraw the Rhino view.
+
+        Notes
+        -----
+        This only re-enables redrawing, which schedules a redraw of the views.
+        To force an immediate redraw, for example after updating multiple artists, use :meth:`flush`.
+
+        """
+        compas_rhino.rs.EnableRedraw(True)
+
+    def clear(self):
+        """Delete all objects created by the artist."""
+        if not self._guids:
+            return
+        compas_rhino.delete_objects(self._guids)
+        self._guids = []
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == "__main__":
+
+    pass
@@ -1,5 +1,13 @@
 from __future__ import absolute_import
 
-from .xforms import *  # noqa : F401 F403
+from .xforms import xform_from_transformation
+from .xforms import xform_from_transformation_matrix
+from .xforms import xtransform
+from .xforms import xtransformed
 
-__all__ = [name for name in dir() if not name.startswith('_')]
+__all__ = [
+    'xform_from_transformation',
+    'xform_from_transformation_matrix',
+    'xtransform',
+    'xtransformed'
+]
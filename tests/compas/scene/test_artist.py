@@ -0,0 +1,62 @@
+import pytest
+
+import compas.scene.artist
+from compas.scene import BaseArtist
+
+
+class FakeItem(object):
+    pass
+
+
+class FakeSubItem(FakeItem):
+    pass
+
+
+class FakeArtist(BaseArtist):
+    def __init__(self, item):
+        self.item = item
+
+
+class FakeSubArtist(FakeArtist):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    monkeypatch.setattr(compas.scene.artist, '_ITEM_ARTIST', {})
+    monkeypatch.setattr(compas.scene.artist, '_ITEM_ARTIST_RESOLVED', {})
+    monkeypatch.setattr(compas.scene.artist, '_ITEM_ARTIST_FROZEN', False)
+
+
+def test_build_registered_type():
+    BaseArtist.register(FakeItem, FakeArtist)
+    artist = BaseArtist.build(FakeItem())
+    assert type(artist) is FakeArtist
+
+
+def test_build_subclass_of_registered_type():
+    BaseArtist.register(FakeItem, FakeArtist)
+    artist = BaseArtist.build(FakeSubItem())
+    assert type(artist) is FakeArtist
+
+
+def test_build_after_registering_subclass():
+    BaseArtist.register(FakeItem, FakeArtist)
+    BaseArtist.build(FakeSubItem())
+    BaseArtist.register(FakeSubItem, FakeSubArtist)
+    artist = BaseArtist.build(FakeSubItem())
+    assert type(artist) is FakeSubArtist
+
+
+def test_build_unregistered_type():
+    with pytest.raises(KeyError):
+        BaseArtist.build(object())
+
+
+def test_register_after_freeze():
+    BaseArtist.register(FakeItem, FakeArtist)
+    BaseArtist.freeze_registry()
+    with pytest.raises(Exception, match='frozen'):
+        BaseArtist.register(FakeSubItem, FakeSubArtist)
+    artist = BaseArtist.build(FakeSubItem())
+    assert type(artist) is FakeArtist